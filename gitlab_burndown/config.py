@@ -1,10 +1,5 @@
 import os
 
-from dotenv import load_dotenv
-
-load_dotenv()
-
-
 CONFIG = None
 
 
@@ -18,9 +13,16 @@ class Config:
 
 
 def get_config() -> Config:
-    """Return a Config instance with the configured values."""
+    """Return a Config instance with the configured values.
+
+    The .env file is loaded on the first call, so importing this module does
+    not touch the file system.
+    """
 
     global CONFIG
     if CONFIG is None:
+        from dotenv import load_dotenv
+
+        load_dotenv()
         CONFIG = Config()
     return CONFIG
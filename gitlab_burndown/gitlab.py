@@ -1,12 +1,17 @@
 from gitlab import Gitlab
 
 from gitlab_burndown.config import get_config
+from gitlab_burndown.scheduler import RateLimitedSession, get_scheduler
 
 
 def get_gitlab() -> Gitlab:
-    """Return a Gitlab instance with the configured URL and access token."""
+    """Return a Gitlab instance with the configured URL and access token.
+
+    Requests are paced by the shared RateLimitScheduler.
+    """
 
     return Gitlab(
         url=get_config().GITLAB_URL,
         private_token=get_config().GITLAB_ACCESS_TOKEN,
+        session=RateLimitedSession(get_scheduler()),
     )
@@ -1,9 +1,14 @@
 from datetime import datetime, timedelta, timezone
 from typing import List, Tuple
 
-import matplotlib.pyplot as plt
+import pyarrow as pa
+import pyarrow.compute as pc
 
-from gitlab_burndown.transformer import TimeInfo
+FIGURE_SIZE = (10, 6)
+FIGURE_DPI = 100
+
+# Keep the highest and lowest point for every pixel column of the chart.
+MAX_PLOT_POINTS = 2 * FIGURE_SIZE[0] * FIGURE_DPI
 
 
 def interpolate_zero_burndown(
@@ -26,18 +31,35 @@ def interpolate_zero_burndown(
     if len(remaining_estimates) < 2:
         raise ValueError("Need at least two data points to interpolate.")
 
+    i = _find_last_decrease(remaining_estimates)
+    if i is None:
+        raise ValueError(
+            "Unable to interpolate; the burndown does not show a decreasing trend."
+        )
+
+    return _calculate_zero_burndown_date(
+        dates[i - 1],
+        dates[i],
+        remaining_estimates[i - 1],
+        remaining_estimates[i],
+    )
+
+
+def _find_last_decrease(remaining_estimates: List[int]) -> int | None:
+    """
+    Finds the last data point where the remaining estimate decreased.
+
+    Args:
+        remaining_estimates (List[int]): List of remaining time estimates (in seconds).
+
+    Returns:
+        int | None: Index i such that remaining_estimates[i] < remaining_estimates[i - 1],
+        or None if the estimates never decrease.
+    """
     for i in range(len(remaining_estimates) - 1, 0, -1):
         if remaining_estimates[i] < remaining_estimates[i - 1]:
-            return _calculate_zero_burndown_date(
-                dates[i - 1],
-                dates[i],
-                remaining_estimates[i - 1],
-                remaining_estimates[i],
-            )
-
-    raise ValueError(
-        "Unable to interpolate; the burndown does not show a decreasing trend."
-    )
+            return i
+    return None
 
 
 def _calculate_zero_burndown_date(
@@ -62,28 +84,36 @@ def _calculate_zero_burndown_date(
 
 
 def prepare_burndown_data(
-    time_info: List[TimeInfo],
+    time_info: pa.Table,
     start_date: datetime,
-) -> Tuple[List[datetime], List[int], List[float], int]:
+) -> Tuple[pa.Array, pa.Array, pa.Array, int]:
     """
     Prepares the burndown data for plotting.
 
+    The data stays in columnar form, so large histories are prepared without
+    creating a Python object per issue.
+
     Args:
-        time_info (List[TimeInfo]): List of TimeInfo objects containing issue data.
+        time_info (pa.Table): Table with the issue data following TIME_INFO_SCHEMA.
+        start_date (datetime): The date to filter issues that were closed after.
 
     Returns:
-        Tuple[List[datetime], List[int], List[float], int]: Tuple containing lists of dates,
+        Tuple[pa.Array, pa.Array, pa.Array, int]: Tuple containing arrays of dates,
         remaining time estimates, remaining time estimates in hours, and total time estimate.
     """
 
     time_info_sorted = _filter_and_sort_time_info(time_info, start_date)
-    total_time_estimate = sum(info.time_estimate for info in time_info_sorted)
+    total_time_estimate = (
+        pc.sum(time_info_sorted.column("time_estimate")).as_py() or 0
+    )
 
     dates, remaining_estimates = _calculate_remaining_estimates(
         time_info_sorted, total_time_estimate
     )
 
-    remaining_estimates_hours = [x / 3600 for x in remaining_estimates]
+    remaining_estimates_hours = pc.divide(
+        pc.cast(remaining_estimates, pa.float64()), 3600
+    )
     return (
         dates,
         remaining_estimates,
@@ -93,71 +123,196 @@ def prepare_burndown_data(
 
 
 def _filter_and_sort_time_info(
-    time_info: List[TimeInfo], start_date: datetime
-) -> List[TimeInfo]:
+    time_info: pa.Table, start_date: datetime
+) -> pa.Table:
     """
     Filters and sorts the time info data by closed_at date, excluding items before the start date.
 
     Args:
-        time_info (List[TimeInfo]): List of TimeInfo objects.
+        time_info (pa.Table): Table with the issue data.
         start_date (datetime): The date to filter issues that were closed after.
 
     Returns:
-        List[TimeInfo]: Sorted and filtered list of TimeInfo objects.
+        pa.Table: Sorted and filtered table.
     """
-    time_info_sorted = sorted(time_info, key=lambda x: x.closed_at)
-    return [info for info in time_info_sorted if info.closed_at >= start_date]
+    closed_at = time_info.column("closed_at")
+    after_start = pc.greater_equal(
+        closed_at, pa.scalar(start_date, closed_at.type)
+    )
+    return time_info.filter(after_start).sort_by("closed_at")
 
 
 def _calculate_remaining_estimates(
-    time_info_sorted: List[TimeInfo], total_time_estimate: int
-) -> Tuple[List[datetime], List[int]]:
+    time_info_sorted: pa.Table, total_time_estimate: int
+) -> Tuple[pa.Array, pa.Array]:
     """
     Calculates the remaining estimates for the burndown chart based on time_info_sorted.
 
     Args:
-        time_info_sorted (List[TimeInfo]): Sorted list of TimeInfo objects.
+        time_info_sorted (pa.Table): Table with the issue data sorted by closed_at.
         total_time_estimate (int): The total time estimate at the beginning.
 
     Returns:
-        Tuple[List[datetime], List[int]]: List of dates and remaining time estimates.
+        Tuple[pa.Array, pa.Array]: Dates and remaining time estimates.
     """
-    dates: List[datetime] = []
-    remaining_estimates: List[int] = []
-    remaining_time = total_time_estimate
-
     without_opened_issues = _filter_out_today_issues(time_info_sorted)
-
-    for info in without_opened_issues:
-        dates.append(info.closed_at)
-        remaining_time -= info.time_estimate
-        remaining_estimates.append(remaining_time)
+    closed_at = without_opened_issues.column("closed_at").combine_chunks()
+    time_estimates = pc.fill_null(
+        without_opened_issues.column("time_estimate").combine_chunks(), 0
+    )
+    remaining_estimates = pc.subtract(
+        pa.scalar(total_time_estimate, pa.int64()),
+        pc.cumulative_sum(time_estimates),
+    )
 
     # Include the starting point in the burndown chart
     start_date = datetime.fromisoformat("2024-09-01T00:00:00+00:00")
-    dates.insert(0, start_date)
-    remaining_estimates.insert(0, total_time_estimate)
+    dates = pa.concat_arrays(
+        [pa.array([start_date], closed_at.type), closed_at]
+    )
+    remaining_estimates = pa.concat_arrays(
+        [pa.array([total_time_estimate], pa.int64()), remaining_estimates]
+    )
 
     return dates, remaining_estimates
 
 
-def _filter_out_today_issues(
-    time_info_sorted: List[TimeInfo],
-) -> List[TimeInfo]:
+def _filter_out_today_issues(time_info_sorted: pa.Table) -> pa.Table:
     """
     Filters out issues that were closed today from the sorted time info.
 
     Args:
-        time_info_sorted (List[TimeInfo]): Sorted list of TimeInfo objects.
+        time_info_sorted (pa.Table): Table with the issue data sorted by closed_at.
+
+    Returns:
+        pa.Table: Table excluding the issues closed today.
+    """
+    today = datetime.now(timezone.utc).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    closed_at = time_info_sorted.column("closed_at")
+    not_today = pc.or_(
+        pc.less(closed_at, pa.scalar(today, closed_at.type)),
+        pc.greater_equal(
+            closed_at, pa.scalar(today + timedelta(days=1), closed_at.type)
+        ),
+    )
+    return time_info_sorted.filter(not_today)
+
+
+def downsample_burndown_data(
+    dates: pa.Array,
+    remaining_estimates: pa.Array,
+    remaining_estimates_hours: pa.Array,
+    max_points: int = MAX_PLOT_POINTS,
+) -> Tuple[List[datetime], List[int], List[float]]:
+    """
+    Reduces the burndown data to at most max_points points for plotting.
+
+    The time range is split into equally wide buckets, one per pixel column,
+    and only the highest and lowest point of each bucket is kept, so every step
+    of the burndown stays visible. The first and last point and the two points
+    used by interpolate_zero_burndown are always kept, so the chart covers the
+    same range and interpolates to the same date. Python objects are only
+    created for the points that are kept.
+
+    Args:
+        dates (pa.Array): Dates of the burndown data points.
+        remaining_estimates (pa.Array): Remaining time estimates (in seconds).
+        remaining_estimates_hours (pa.Array): Remaining time estimates in hours.
+        max_points (int): Maximum number of points to return.
+
+    Returns:
+        Tuple[List[datetime], List[int], List[float]]: The downsampled dates,
+        remaining time estimates and remaining time estimates in hours.
+
+    Raises:
+        ValueError: If max_points is too small to keep the required points.
+    """
+    if max_points < 6:
+        raise ValueError("Need at least six points to downsample.")
+    if len(dates) > max_points:
+        selected = _select_bucket_extremes(
+            dates, remaining_estimates, max_points
+        )
+        dates = dates.take(selected)
+        remaining_estimates = remaining_estimates.take(selected)
+        remaining_estimates_hours = remaining_estimates_hours.take(selected)
+
+    return (
+        dates.to_pylist(),
+        remaining_estimates.to_pylist(),
+        remaining_estimates_hours.to_pylist(),
+    )
+
+
+def _select_bucket_extremes(
+    dates: pa.Array, remaining_estimates: pa.Array, max_points: int
+) -> pa.Array:
+    """
+    Selects the indices of the points to keep when downsampling.
+
+    Args:
+        dates (pa.Array): Dates of the burndown data points.
+        remaining_estimates (pa.Array): Remaining time estimates (in seconds).
+        max_points (int): Maximum number of indices to return.
 
     Returns:
-        List[TimeInfo]: List of issues excluding the ones closed today.
+        pa.Array: Sorted indices of the points to keep.
     """
-    return [
-        x
-        for x in time_info_sorted
-        if x.closed_at.date() != datetime.now(timezone.utc).date()
-    ]
+    last = len(dates) - 1
+    required = {0, last}
+    i = _find_last_decrease_in_array(remaining_estimates)
+    if i is not None:
+        required.update((i - 1, i))
+
+    buckets = (max_points - len(required)) // 2
+    # The dates are not necessarily sorted, as the fixed starting point of the
+    # burndown can lie after the first closed issues.
+    timestamps = pc.cast(dates, pa.int64())
+    bounds = pc.min_max(timestamps)
+    earliest = bounds["min"].as_py()
+    span = (bounds["max"].as_py() - earliest) or 1
+    offsets = pc.cast(pc.subtract(timestamps, earliest), pa.float64())
+    bucket = pc.cast(pc.floor(pc.multiply(offsets, buckets / span)), pa.int64())
+    bucket = pc.max_element_wise(pc.min_element_wise(bucket, buckets - 1), 0)
+
+    # Sorting by bucket and descending value puts the highest point of each
+    # bucket first and the lowest point last. The sort is stable, so ties
+    # keep the first highest and the last lowest point.
+    order = pc.sort_indices(
+        pa.table({"bucket": bucket, "value": remaining_estimates}),
+        sort_keys=[("bucket", "ascending"), ("value", "descending")],
+    )
+    sorted_bucket = bucket.take(order)
+    bucket_changes = pc.not_equal(sorted_bucket[1:], sorted_bucket[:-1])
+    is_first = pa.concat_arrays([pa.array([True]), bucket_changes])
+    is_last = pa.concat_arrays([bucket_changes, pa.array([True])])
+    extremes = order.filter(pc.or_(is_first, is_last))
+
+    selected = pc.unique(
+        pa.concat_arrays([extremes, pa.array(sorted(required), order.type)])
+    )
+    return selected.take(pc.sort_indices(selected))
+
+
+def _find_last_decrease_in_array(remaining_estimates: pa.Array) -> int | None:
+    """
+    Columnar counterpart of _find_last_decrease.
+
+    Args:
+        remaining_estimates (pa.Array): Remaining time estimates (in seconds).
+
+    Returns:
+        int | None: Index i such that remaining_estimates[i] < remaining_estimates[i - 1],
+        or None if the estimates never decrease.
+    """
+    decreases = pc.indices_nonzero(
+        pc.less(remaining_estimates[1:], remaining_estimates[:-1])
+    )
+    if len(decreases) == 0:
+        return None
+    return decreases[-1].as_py() + 1
 
 
 def draw_plot(
@@ -175,9 +330,11 @@ def draw_plot(
         remaining_estimates_hours (List[float]): List of remaining time estimates in hours.
         total_time_estimate (int): The total time estimate in seconds.
     """
+    import matplotlib.pyplot as plt
+
     estimated_zero_date = interpolate_zero_burndown(dates, remaining_estimates)
 
-    plt.figure(figsize=(10, 6))
+    plt.figure(figsize=FIGURE_SIZE, dpi=FIGURE_DPI)
     plt.fill_between(dates, remaining_estimates_hours, color="b", alpha=0.5)
     plt.ylim(0, total_time_estimate / 3600 + 10)
     plt.text(
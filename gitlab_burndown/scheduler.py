@@ -0,0 +1,173 @@
+import heapq
+import itertools
+import threading
+import time
+from typing import Any, Callable, Mapping
+from urllib.parse import urlparse
+
+import requests
+
+PROJECT_PRIORITY = 0
+ISSUE_PAGE_PRIORITY = 1
+
+DEFAULT_CAPACITY = 10.0
+MIN_RATE = 0.1
+
+SCHEDULER = None
+
+
+class RateLimitScheduler:
+    """Token bucket that paces Gitlab API requests by the rate limit headers.
+
+    Requests take a token from the bucket before they are sent. The refill
+    rate follows the RateLimit-Remaining and RateLimit-Reset headers of the
+    responses, so the remaining budget is spread evenly until the reset. Until
+    the first response with these headers arrives, or if the instance never
+    sends them, requests are not paced; a 429 response still pauses them.
+    When several threads are waiting, the one with the lowest priority value
+    is served first.
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        capacity: float = DEFAULT_CAPACITY,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._clock = clock
+        self._updated_at = clock()
+        self._paused_until = 0.0
+        self._waiters: list[tuple[int, int]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+
+    def acquire(self, priority: int = ISSUE_PAGE_PRIORITY) -> None:
+        """Block until a token is available for a request of the given priority."""
+
+        with self._condition:
+            ticket = (priority, next(self._counter))
+            heapq.heappush(self._waiters, ticket)
+            try:
+                while not self._try_take(ticket):
+                    self._condition.wait(timeout=self._wait_time(ticket))
+            except BaseException:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                self._condition.notify_all()
+                raise
+
+    def update(self, status_code: int, headers: Mapping[str, str]) -> None:
+        """Adapt the bucket to the rate limit headers of a Gitlab response."""
+
+        with self._condition:
+            self._refill()
+            now = self._clock()
+            remaining = _get_number(headers, "RateLimit-Remaining")
+            reset = _get_number(headers, "RateLimit-Reset")
+
+            seconds_to_reset = None
+            if reset is not None:
+                seconds_to_reset = max(reset - time.time(), 1.0)
+                if remaining is not None:
+                    self.rate = max(remaining / seconds_to_reset, MIN_RATE)
+            if remaining is not None:
+                self.tokens = min(self.tokens, remaining)
+
+            if status_code == 429 or remaining == 0:
+                retry_after = _get_number(headers, "Retry-After")
+                pause = retry_after or seconds_to_reset or 1.0
+                self.tokens = 0.0
+                self._paused_until = max(self._paused_until, now + pause)
+
+            self._condition.notify_all()
+
+    def _try_take(self, ticket: tuple[int, int]) -> bool:
+        """Take a token if the ticket is first in line and one is available."""
+
+        self._refill()
+        if (
+            self._waiters[0] != ticket
+            or self._clock() < self._paused_until
+            or (self.rate is not None and self.tokens < 1)
+        ):
+            return False
+        heapq.heappop(self._waiters)
+        if self.rate is not None:
+            self.tokens -= 1
+        self._condition.notify_all()
+        return True
+
+    def _wait_time(self, ticket: tuple[int, int]) -> float | None:
+        """Return how long to wait before checking the bucket again."""
+
+        if self._waiters[0] != ticket:
+            return None
+        now = self._clock()
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self.rate is None:
+            return 0.0
+        return max((1 - self.tokens) / self.rate, 0.0)
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last refill."""
+
+        now = self._clock()
+        if now > self._paused_until:
+            if self.rate is None:
+                self.tokens = self.capacity
+            else:
+                elapsed = now - max(self._updated_at, self._paused_until)
+                self.tokens = min(
+                    self.capacity, self.tokens + elapsed * self.rate
+                )
+        self._updated_at = now
+
+
+class RateLimitedSession(requests.Session):
+    """Requests session that sends every request through a RateLimitScheduler."""
+
+    def __init__(self, scheduler: RateLimitScheduler) -> None:
+        super().__init__()
+        self.scheduler = scheduler
+
+    def request(  # type: ignore[override]
+        self, method: str | bytes, url: str | bytes, *args: Any, **kwargs: Any
+    ) -> requests.Response:
+        self.scheduler.acquire(get_request_priority(str(url)))
+        response = super().request(method, url, *args, **kwargs)
+        self.scheduler.update(response.status_code, response.headers)
+        return response
+
+
+def get_request_priority(url: str) -> int:
+    """Return the scheduling priority for a Gitlab API URL.
+
+    Project lookups are needed before any issue page can be fetched, so they
+    are served ahead of the bulk issue pages.
+    """
+
+    if "/issues" in urlparse(url).path:
+        return ISSUE_PAGE_PRIORITY
+    return PROJECT_PRIORITY
+
+
+def get_scheduler() -> RateLimitScheduler:
+    """Return the RateLimitScheduler shared by all Gitlab clients."""
+
+    global SCHEDULER
+    if SCHEDULER is None:
+        SCHEDULER = RateLimitScheduler()
+    return SCHEDULER
+
+
+def _get_number(headers: Mapping[str, str], name: str) -> float | None:
+    """Return a numeric header value, or None if it is missing or invalid."""
+
+    try:
+        return float(headers[name])
+    except (KeyError, TypeError, ValueError):
+        return None
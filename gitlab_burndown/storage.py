@@ -0,0 +1,220 @@
+from pathlib import Path
+from typing import List
+
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+
+from gitlab_burndown.transformer import TimeInfo
+
+TIME_INFO_SCHEMA = pa.schema(
+    [
+        pa.field("closed_at", pa.timestamp("us", tz="UTC"), nullable=False),
+        pa.field("time_estimate", pa.int64()),
+        pa.field("created_at", pa.timestamp("us", tz="UTC")),
+    ]
+)
+
+BURNDOWN_SCHEMA = pa.schema(
+    [
+        pa.field("date", pa.timestamp("us", tz="UTC"), nullable=False),
+        pa.field("remaining_estimate", pa.int64(), nullable=False),
+        pa.field("remaining_estimate_hours", pa.float64(), nullable=False),
+    ]
+)
+
+PARQUET_SUFFIXES = {".parquet", ".pq"}
+ARROW_SUFFIXES = {".arrow", ".feather", ".ipc"}
+
+
+def time_info_to_table(time_info: List[TimeInfo]) -> pa.Table:
+    """
+    Converts a list of TimeInfo objects into a columnar Arrow table.
+
+    Args:
+        time_info (List[TimeInfo]): List of TimeInfo objects.
+
+    Returns:
+        pa.Table: Table with one row per issue following TIME_INFO_SCHEMA.
+    """
+    return pa.table(
+        {
+            "closed_at": [info.closed_at for info in time_info],
+            "time_estimate": [info.time_estimate for info in time_info],
+            "created_at": [info.created_at for info in time_info],
+        },
+        schema=TIME_INFO_SCHEMA,
+    )
+
+
+def table_to_time_info(table: pa.Table) -> List[TimeInfo]:
+    """
+    Converts an Arrow table following TIME_INFO_SCHEMA back into TimeInfo objects.
+
+    Args:
+        table (pa.Table): Table containing the issue time data.
+
+    Returns:
+        List[TimeInfo]: List of TimeInfo objects, one per row.
+    """
+    table = normalize_time_info_table(table)
+    closed_at = table.column("closed_at").to_pylist()
+    time_estimates = table.column("time_estimate").to_pylist()
+    created_at = table.column("created_at").to_pylist()
+    return [
+        TimeInfo(closed_at=closed, time_estimate=estimate, created_at=created)
+        for closed, estimate, created in zip(
+            closed_at, time_estimates, created_at
+        )
+    ]
+
+
+def normalize_time_info_table(table: pa.Table) -> pa.Table:
+    """
+    Brings an Arrow table with issue time data into the TIME_INFO_SCHEMA layout.
+
+    Tables without a created_at column, as written by earlier versions, are
+    accepted and get an empty one. Columns that already have the expected
+    type keep their buffers.
+
+    Args:
+        table (pa.Table): Table containing the issue time data.
+
+    Returns:
+        pa.Table: Table following TIME_INFO_SCHEMA.
+    """
+    if "created_at" not in table.column_names:
+        table = table.append_column(
+            TIME_INFO_SCHEMA.field("created_at"),
+            pa.nulls(table.num_rows, pa.timestamp("us", tz="UTC")),
+        )
+    table = table.select(TIME_INFO_SCHEMA.names)
+    if table.schema.equals(TIME_INFO_SCHEMA):
+        return table
+    return table.cast(TIME_INFO_SCHEMA)
+
+
+def burndown_to_table(
+    dates: pa.Array,
+    remaining_estimates: pa.Array,
+    remaining_estimates_hours: pa.Array,
+) -> pa.Table:
+    """
+    Combines the computed burndown series into a columnar Arrow table.
+
+    Args:
+        dates (pa.Array): Dates of the burndown data points.
+        remaining_estimates (pa.Array): Remaining time estimates (in seconds).
+        remaining_estimates_hours (pa.Array): Remaining time estimates in hours.
+
+    Returns:
+        pa.Table: Table with one row per data point following BURNDOWN_SCHEMA.
+    """
+    return pa.table(
+        {
+            "date": dates,
+            "remaining_estimate": remaining_estimates,
+            "remaining_estimate_hours": remaining_estimates_hours,
+        },
+        schema=BURNDOWN_SCHEMA,
+    )
+
+
+def write_table(table: pa.Table, path: str | Path) -> None:
+    """
+    Writes an Arrow table to disk, choosing the format from the file suffix.
+
+    Parquet files (.parquet, .pq) are compressed and suited for exchange with
+    other analytics tools. Arrow IPC files (.arrow, .feather, .ipc) are written
+    uncompressed so they can be memory-mapped without copying when read back.
+
+    Args:
+        table (pa.Table): The table to write.
+        path (str | Path): Destination file path.
+
+    Raises:
+        ValueError: If the file suffix does not match a supported format.
+    """
+    suffix = _get_suffix(path)
+    if suffix in PARQUET_SUFFIXES:
+        pq.write_table(table, path)
+    else:
+        feather.write_feather(table, path, compression="uncompressed")
+
+
+def read_table(path: str | Path) -> pa.Table:
+    """
+    Reads an Arrow table from disk, choosing the format from the file suffix.
+
+    Both formats are read through a memory map, so Arrow IPC files are loaded
+    without copying their buffers.
+
+    Args:
+        path (str | Path): Source file path.
+
+    Returns:
+        pa.Table: The table stored in the file.
+
+    Raises:
+        ValueError: If the file suffix does not match a supported format.
+    """
+    suffix = _get_suffix(path)
+    if suffix in PARQUET_SUFFIXES:
+        return pq.read_table(path, memory_map=True)
+    return feather.read_table(path, memory_map=True)
+
+
+def export_time_info(time_info: pa.Table, path: str | Path) -> None:
+    """Writes the issue time data to a Parquet or Arrow IPC file."""
+
+    write_table(normalize_time_info_table(time_info), path)
+
+
+def import_time_info(path: str | Path) -> pa.Table:
+    """
+    Reads issue time data previously written by export_time_info.
+
+    The data stays in columnar form; for Arrow IPC files the returned table
+    refers directly to the memory-mapped file.
+    """
+
+    return normalize_time_info_table(read_table(path))
+
+
+def export_burndown_data(
+    dates: pa.Array,
+    remaining_estimates: pa.Array,
+    remaining_estimates_hours: pa.Array,
+    path: str | Path,
+) -> None:
+    """Writes the computed burndown series to a Parquet or Arrow IPC file."""
+
+    table = burndown_to_table(
+        dates, remaining_estimates, remaining_estimates_hours
+    )
+    write_table(table, path)
+
+
+def import_burndown_data(path: str | Path) -> pa.Table:
+    """Reads a burndown series previously written by export_burndown_data."""
+
+    table = read_table(path).select(BURNDOWN_SCHEMA.names)
+    if table.schema.equals(BURNDOWN_SCHEMA):
+        return table
+    return table.cast(BURNDOWN_SCHEMA)
+
+
+def _get_suffix(path: str | Path) -> str:
+    """
+    Returns the lower-cased file suffix if it names a supported format.
+
+    Raises:
+        ValueError: If the file suffix does not match a supported format.
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix not in PARQUET_SUFFIXES | ARROW_SUFFIXES:
+        raise ValueError(
+            f"Unsupported file format '{suffix}'. Use one of: "
+            f"{', '.join(sorted(PARQUET_SUFFIXES | ARROW_SUFFIXES))}."
+        )
+    return suffix
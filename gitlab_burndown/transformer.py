@@ -1,17 +1,21 @@
 import datetime
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
-from gitlab.v4.objects import ProjectIssue
+if TYPE_CHECKING:
+    from gitlab.v4.objects import ProjectIssue
 
 
 @dataclass
 class TimeInfo:
     closed_at: datetime.datetime
     time_estimate: int
+    created_at: datetime.datetime | None = None
 
 
-def transform_issue_to_time_info(issue: ProjectIssue) -> TimeInfo:
+def transform_issue_to_time_info(issue: "ProjectIssue") -> TimeInfo:
     closed_at_str: str | None = issue.attributes.get("closed_at")
+    created_at_str: str | None = issue.attributes.get("created_at")
     return TimeInfo(
         closed_at=(
             datetime.datetime.fromisoformat(
@@ -23,4 +27,11 @@ def transform_issue_to_time_info(issue: ProjectIssue) -> TimeInfo:
         time_estimate=issue.attributes.get("time_stats", {}).get(
             "time_estimate"
         ),
+        created_at=(
+            datetime.datetime.fromisoformat(
+                created_at_str.replace("Z", "+00:00")
+            )
+            if created_at_str
+            else None
+        ),
     )
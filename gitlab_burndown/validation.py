@@ -0,0 +1,125 @@
+from dataclasses import dataclass, field
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from gitlab_burndown.storage import normalize_time_info_table
+
+# Estimates further than this many interquartile ranges above the third
+# quartile are reported as outliers.
+OUTLIER_IQR_FACTOR = 3.0
+
+# Estimates up to one working week are never reported as outliers.
+MIN_OUTLIER_ESTIMATE = 40 * 3600
+
+
+@dataclass
+class ValidationReport:
+    """Counts of the problems found in the issue time data."""
+
+    total: int
+    missing_estimates: int
+    invalid_estimates: int
+    outliers: int
+    closed_before_created: int
+    valid: pa.ChunkedArray = field(repr=False)
+
+    @property
+    def has_problems(self) -> bool:
+        return (
+            self.missing_estimates
+            + self.invalid_estimates
+            + self.outliers
+            + self.closed_before_created
+        ) > 0
+
+    def summary(self) -> str:
+        """Return a human readable summary of the report."""
+
+        skipped = self.total - _count(self.valid)
+        return "\n".join(
+            [
+                f"Validated {self.total} issues, skipped {skipped}:",
+                f"  missing time estimate:  {self.missing_estimates}",
+                f"  negative time estimate: {self.invalid_estimates}",
+                f"  outlier time estimate:  {self.outliers}",
+                f"  closed before created:  {self.closed_before_created}",
+            ]
+        )
+
+
+def validate_time_info(time_info: pa.Table) -> ValidationReport:
+    """
+    Checks the issue time data for missing or implausible values.
+
+    The checks run as Arrow compute kernels over the columns of the whole
+    dataset instead of looping over the issues in Python. Issues with a
+    missing or negative time estimate are marked as invalid, as they cannot be
+    summed up for the burndown. Outliers and issues closed before they were
+    created are only reported.
+
+    Args:
+        time_info (pa.Table): Table with the issue data.
+
+    Returns:
+        ValidationReport: Counts of the problems found and a mask of the
+        valid issues.
+    """
+    table = normalize_time_info_table(time_info)
+    estimates = table.column("time_estimate")
+
+    missing = pc.is_null(estimates)
+    invalid = pc.fill_null(pc.less(estimates, 0), False)
+    valid = pc.and_(pc.invert(missing), pc.invert(invalid))
+    outliers = _find_outliers(estimates, valid)
+    closed_before_created = pc.fill_null(
+        pc.less(table.column("closed_at"), table.column("created_at")), False
+    )
+
+    return ValidationReport(
+        total=table.num_rows,
+        missing_estimates=_count(missing),
+        invalid_estimates=_count(invalid),
+        outliers=_count(outliers),
+        closed_before_created=_count(closed_before_created),
+        valid=valid,
+    )
+
+
+def filter_valid_time_info(
+    time_info: pa.Table, report: ValidationReport
+) -> pa.Table:
+    """Return the issues that the report marked as valid."""
+
+    return time_info.filter(report.valid)
+
+
+def _find_outliers(
+    estimates: pa.ChunkedArray, valid: pa.ChunkedArray
+) -> pa.ChunkedArray:
+    """
+    Flags estimates far above the interquartile range of the valid estimates.
+
+    Args:
+        estimates (pa.ChunkedArray): The time estimates (in seconds).
+        valid (pa.ChunkedArray): Mask of the estimates to consider.
+
+    Returns:
+        pa.ChunkedArray: Mask of the outlier estimates.
+    """
+    valid_estimates = pc.filter(estimates, valid)
+    if len(valid_estimates) == 0:
+        # Nothing to compare against, and valid is all false in this case
+        return valid
+
+    q1, q3 = pc.quantile(valid_estimates, q=[0.25, 0.75]).to_pylist()
+    threshold = max(
+        q3 + OUTLIER_IQR_FACTOR * (q3 - q1), float(MIN_OUTLIER_ESTIMATE)
+    )
+    return pc.fill_null(pc.greater(estimates, threshold), False)
+
+
+def _count(mask: pa.ChunkedArray) -> int:
+    """Return the number of true values in a boolean mask."""
+
+    return pc.sum(mask).as_py() or 0
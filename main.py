@@ -1,15 +1,19 @@
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 import typer
-from gitlab.v4.objects import ProjectIssue
 
 from gitlab_burndown.config import get_config
-from gitlab_burndown.discovery import (
-    get_issues_for_project,
-    search_project_id_by_project_name,
-)
-from gitlab_burndown.plotting import draw_plot, prepare_burndown_data
-from gitlab_burndown.transformer import TimeInfo, transform_issue_to_time_info
+from gitlab_burndown.transformer import transform_issue_to_time_info
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+    from gitlab.v4.objects import ProjectIssue
+
+# python-gitlab and pyarrow are imported inside the command where they are
+# needed, and matplotlib inside draw_plot, to keep `--help` and argument
+# errors fast.
 
 app = typer.Typer()
 
@@ -35,16 +39,63 @@ def burndown(
     duration: str = typer.Argument(
         "30d", help="Duration string like '30d' for 30 days, '2m' for 2 months."
     ),
+    input_file: Optional[Path] = typer.Option(
+        None,
+        "--input",
+        help="Read issue data from a Parquet/Arrow file instead of Gitlab.",
+    ),
+    export_file: Optional[Path] = typer.Option(
+        None,
+        "--export",
+        help="Write the issue data to a Parquet/Arrow file.",
+    ),
+    export_burndown_file: Optional[Path] = typer.Option(
+        None,
+        "--export-burndown",
+        help="Write the computed burndown series to a Parquet/Arrow file.",
+    ),
 ):
     """Main function to run the burndown chart generation."""
-    project_id: int = search_project_id_by_project_name(
-        get_config().GITLAB_PROJECT_NAME
+    from gitlab_burndown.plotting import (
+        downsample_burndown_data,
+        draw_plot,
+        prepare_burndown_data,
+    )
+    from gitlab_burndown.storage import (
+        export_burndown_data,
+        export_time_info,
+        import_time_info,
+        time_info_to_table,
+    )
+    from gitlab_burndown.validation import (
+        filter_valid_time_info,
+        validate_time_info,
     )
-    issues: list[ProjectIssue] = get_issues_for_project(project_id)
 
-    time_info: list[TimeInfo] = [
-        transform_issue_to_time_info(issue) for issue in issues
-    ]
+    time_info: "pa.Table"
+    if input_file is not None:
+        time_info = import_time_info(input_file)
+    else:
+        from gitlab_burndown.discovery import (
+            get_issues_for_project,
+            search_project_id_by_project_name,
+        )
+
+        project_id: int = search_project_id_by_project_name(
+            get_config().GITLAB_PROJECT_NAME
+        )
+        issues: list["ProjectIssue"] = get_issues_for_project(project_id)
+        time_info = time_info_to_table(
+            [transform_issue_to_time_info(issue) for issue in issues]
+        )
+
+    if export_file is not None:
+        export_time_info(time_info, export_file)
+
+    report = validate_time_info(time_info)
+    if report.has_problems:
+        typer.echo(report.summary(), err=True)
+    time_info = filter_valid_time_info(time_info, report)
 
     start_date = parse_duration(duration)
 
@@ -55,6 +106,20 @@ def burndown(
         total_time_estimate,
     ) = prepare_burndown_data(time_info, start_date)
 
+    if export_burndown_file is not None:
+        export_burndown_data(
+            dates,
+            remaining_estimates,
+            remaining_estimates_hours,
+            export_burndown_file,
+        )
+
+    dates, remaining_estimates, remaining_estimates_hours = (
+        downsample_burndown_data(
+            dates, remaining_estimates, remaining_estimates_hours
+        )
+    )
+
     draw_plot(
         dates,
         remaining_estimates,
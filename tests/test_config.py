@@ -13,10 +13,11 @@ def mock_getenv(key, default=None):
     return mock_environment_variables.get(key, default)
 
 
-@patch("gitlab_burndown.config.load_dotenv", None)
+@patch("dotenv.load_dotenv")
 @patch("gitlab_burndown.config.os.getenv", mock_getenv)
-def test_get_config():
+def test_get_config(mock_load_dotenv):
     config = get_config()
     assert config.GITLAB_ACCESS_TOKEN == "123"
     assert config.GITLAB_URL == "https://test-gitlab.com"
     assert config.GITLAB_PROJECT_NAME == "test"
+    mock_load_dotenv.assert_called_once()
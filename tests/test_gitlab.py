@@ -1,6 +1,7 @@
 from unittest.mock import patch
 
 from gitlab_burndown.gitlab import get_gitlab
+from gitlab_burndown.scheduler import RateLimitedSession
 
 
 @patch("gitlab_burndown.gitlab.get_config")
@@ -13,10 +14,12 @@ def test_get_gitlab(mock_gitlab, mock_get_config) -> None:
     # Call the function
     gitlab_instance = get_gitlab()
 
-    # Assert that Gitlab was called with correct URL and token
-    mock_gitlab.assert_called_once_with(
-        url="https://mock-gitlab-url.com", private_token="mock-access-token"
-    )
+    # Assert that Gitlab was called with correct URL, token and session
+    mock_gitlab.assert_called_once()
+    kwargs = mock_gitlab.call_args.kwargs
+    assert kwargs["url"] == "https://mock-gitlab-url.com"
+    assert kwargs["private_token"] == "mock-access-token"
+    assert isinstance(kwargs["session"], RateLimitedSession)
 
     # Assert the returned instance is what we expect
     assert gitlab_instance == mock_gitlab.return_value
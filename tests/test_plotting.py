@@ -1,16 +1,19 @@
 from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 
+import pyarrow as pa
 import pytest
 
 from gitlab_burndown.plotting import (
     _calculate_zero_burndown_date,
     _filter_and_sort_time_info,
     _filter_out_today_issues,
+    downsample_burndown_data,
     draw_plot,
     interpolate_zero_burndown,
     prepare_burndown_data,
 )
+from gitlab_burndown.storage import time_info_to_table
 from gitlab_burndown.transformer import TimeInfo
 
 
@@ -70,27 +73,130 @@ def test_prepare_burndown_data():
         remaining_estimates,
         remaining_estimates_hours,
         total_time_estimate,
-    ) = prepare_burndown_data(time_info, start_date)
+    ) = prepare_burndown_data(time_info_to_table(time_info), start_date)
 
     assert (
         len(dates) == len(remaining_estimates) == len(remaining_estimates_hours)
     )
     assert total_time_estimate == 1800
-    assert dates[0] == datetime(2024, 9, 1, tzinfo=timezone.utc)
+    assert dates[0].as_py() == datetime(2024, 9, 1, tzinfo=timezone.utc)
+    assert remaining_estimates.to_pylist() == [1800, 800, 300, 0]
+    assert remaining_estimates_hours[1].as_py() == 800 / 3600
+
+
+def create_burndown_series(
+    count: int,
+) -> tuple[list[datetime], list[int], list[float]]:
+    start = datetime(2024, 9, 1, tzinfo=timezone.utc)
+    dates = [start + timedelta(hours=i) for i in range(count)]
+    remaining_estimates = [(count - i) * 600 for i in range(count)]
+    remaining_estimates_hours = [x / 3600 for x in remaining_estimates]
+    return dates, remaining_estimates, remaining_estimates_hours
+
+
+def to_arrays(
+    dates: list[datetime],
+    remaining_estimates: list[int],
+    remaining_estimates_hours: list[float],
+) -> tuple[pa.Array, pa.Array, pa.Array]:
+    return (
+        pa.array(dates, pa.timestamp("us", tz="UTC")),
+        pa.array(remaining_estimates, pa.int64()),
+        pa.array(remaining_estimates_hours, pa.float64()),
+    )
+
+
+def test_downsample_burndown_data_below_limit():
+    series = create_burndown_series(10)
+
+    assert (
+        downsample_burndown_data(*to_arrays(*series), max_points=10) == series
+    )
+
+
+def test_downsample_burndown_data_bounds_points():
+    dates, remaining_estimates, remaining_estimates_hours = (
+        create_burndown_series(10_000)
+    )
+
+    (
+        sampled_dates,
+        sampled_estimates,
+        sampled_estimates_hours,
+    ) = downsample_burndown_data(
+        *to_arrays(dates, remaining_estimates, remaining_estimates_hours),
+        max_points=100,
+    )
+
+    assert len(sampled_dates) <= 100
+    assert len(sampled_dates) == len(sampled_estimates)
+    assert len(sampled_dates) == len(sampled_estimates_hours)
+    assert sampled_dates == sorted(sampled_dates)
+    assert sampled_dates[0] == dates[0]
+    assert sampled_dates[-1] == dates[-1]
+    assert sampled_estimates[-1] == remaining_estimates[-1]
+
+
+def test_downsample_burndown_data_keeps_interpolation():
+    dates, remaining_estimates, remaining_estimates_hours = (
+        create_burndown_series(5_000)
+    )
+    # Flat tail so that the last decrease is not at the end of the series
+    remaining_estimates[-100:] = [remaining_estimates[-101]] * 100
+
+    sampled_dates, sampled_estimates, _ = downsample_burndown_data(
+        *to_arrays(dates, remaining_estimates, remaining_estimates_hours),
+        max_points=50,
+    )
+
+    assert interpolate_zero_burndown(
+        sampled_dates, sampled_estimates
+    ) == interpolate_zero_burndown(dates, remaining_estimates)
+
+
+def test_downsample_burndown_data_with_unsorted_dates():
+    dates, remaining_estimates, remaining_estimates_hours = (
+        create_burndown_series(30_000)
+    )
+    # Like the fixed starting point of the burndown, the first point lies
+    # after most of the closed issues
+    dates[0] = dates[-1] - timedelta(days=10)
+
+    sampled_dates, sampled_estimates, _ = downsample_burndown_data(
+        *to_arrays(dates, remaining_estimates, remaining_estimates_hours),
+        max_points=100,
+    )
+
+    assert len(sampled_dates) <= 100
+    assert sampled_dates[0] == dates[0]
+    assert sampled_dates[-1] == dates[-1]
+    assert sampled_estimates[0] == remaining_estimates[0]
+
+
+def test_downsample_burndown_data_too_few_points():
+    with pytest.raises(ValueError, match="Need at least six points"):
+        downsample_burndown_data(
+            *to_arrays(*create_burndown_series(10)), max_points=5
+        )
 
 
 def test_filter_and_sort_time_info():
-    start_date = datetime(2024, 9, 1)
+    start_date = datetime(2024, 9, 1, tzinfo=timezone.utc)
     time_info = [
-        create_time_info(datetime(2024, 8, 31), 1000),  # Should be filtered out
-        create_time_info(datetime(2024, 9, 5), 500),
-        create_time_info(datetime(2024, 9, 10), 300),
+        create_time_info(datetime(2024, 9, 10, tzinfo=timezone.utc), 300),
+        # Should be filtered out
+        create_time_info(datetime(2024, 8, 31, tzinfo=timezone.utc), 1000),
+        create_time_info(datetime(2024, 9, 5, tzinfo=timezone.utc), 500),
     ]
 
-    filtered_sorted = _filter_and_sort_time_info(time_info, start_date)
+    filtered_sorted = _filter_and_sort_time_info(
+        time_info_to_table(time_info), start_date
+    )
 
-    assert len(filtered_sorted) == 2
-    assert filtered_sorted[0].closed_at == datetime(2024, 9, 5)
+    assert filtered_sorted.num_rows == 2
+    assert filtered_sorted.column("closed_at")[0].as_py() == datetime(
+        2024, 9, 5, tzinfo=timezone.utc
+    )
 
 
 def test_filter_out_today_issues():
@@ -103,9 +209,9 @@ def test_filter_out_today_issues():
         create_time_info(today, 500),
     ]
 
-    filtered = _filter_out_today_issues(time_info)
-    assert len(filtered) == 1
-    assert filtered[0].closed_at == past_date
+    filtered = _filter_out_today_issues(time_info_to_table(time_info))
+    assert filtered.num_rows == 1
+    assert filtered.column("closed_at")[0].as_py() == past_date
 
 
 @patch("matplotlib.pyplot.savefig")
@@ -0,0 +1,163 @@
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from gitlab_burndown.scheduler import (
+    ISSUE_PAGE_PRIORITY,
+    PROJECT_PRIORITY,
+    RateLimitedSession,
+    RateLimitScheduler,
+    get_request_priority,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_acquire_takes_token():
+    scheduler = RateLimitScheduler(rate=1.0, capacity=2.0, clock=FakeClock())
+
+    scheduler.acquire()
+
+    assert scheduler.tokens == 1.0
+
+
+def test_acquire_is_unpaced_without_rate_limit_headers():
+    scheduler = RateLimitScheduler(capacity=2.0, clock=FakeClock())
+
+    for _ in range(100):
+        scheduler.acquire()
+
+    assert scheduler.rate is None
+
+
+def test_update_starts_pacing_with_rate_limit_headers():
+    scheduler = RateLimitScheduler(clock=FakeClock())
+    headers = {
+        "RateLimit-Remaining": "5",
+        "RateLimit-Reset": str(time.time() + 10),
+    }
+
+    scheduler.update(200, headers)
+
+    assert scheduler.rate == pytest.approx(0.5, rel=0.05)
+    assert scheduler.tokens == 5.0
+
+
+def test_update_pauses_unpaced_scheduler_after_too_many_requests():
+    scheduler = RateLimitScheduler()
+
+    scheduler.update(429, {"Retry-After": "0.2"})
+    start = time.monotonic()
+    scheduler.acquire()
+
+    assert time.monotonic() - start >= 0.15
+    assert scheduler.rate is None
+
+
+def test_tokens_refill_over_time():
+    clock = FakeClock()
+    scheduler = RateLimitScheduler(rate=2.0, capacity=5.0, clock=clock)
+    scheduler.tokens = 0.0
+
+    clock.now = 1.0
+    scheduler.acquire()
+
+    assert scheduler.tokens == pytest.approx(1.0)
+
+
+def test_update_adapts_rate_to_headers():
+    scheduler = RateLimitScheduler(rate=10.0, capacity=10.0, clock=FakeClock())
+    headers = {
+        "RateLimit-Remaining": "30",
+        "RateLimit-Reset": str(time.time() + 60),
+    }
+
+    scheduler.update(200, headers)
+
+    assert scheduler.rate == pytest.approx(0.5, rel=0.05)
+    assert scheduler.tokens == 10.0
+
+
+def test_update_caps_tokens_at_remaining():
+    scheduler = RateLimitScheduler(rate=10.0, capacity=10.0, clock=FakeClock())
+
+    scheduler.update(200, {"RateLimit-Remaining": "3"})
+
+    assert scheduler.tokens == 3.0
+
+
+def test_update_pauses_after_too_many_requests():
+    clock = FakeClock()
+    scheduler = RateLimitScheduler(rate=10.0, capacity=10.0, clock=clock)
+
+    scheduler.update(429, {"Retry-After": "5"})
+
+    assert scheduler.tokens == 0.0
+    clock.now = 4.0
+    scheduler._refill()
+    assert scheduler.tokens == 0.0
+    clock.now = 5.5
+    scheduler._refill()
+    assert scheduler.tokens == pytest.approx(5.0)
+
+
+def test_acquire_serves_higher_priority_first():
+    scheduler = RateLimitScheduler(rate=1000.0, capacity=1.0)
+    scheduler.tokens = 0.0
+    scheduler._paused_until = scheduler._clock() + 0.2
+    order: list[str] = []
+
+    def worker(name: str, priority: int) -> None:
+        scheduler.acquire(priority)
+        order.append(name)
+
+    issues = threading.Thread(
+        target=worker, args=("issues", ISSUE_PAGE_PRIORITY)
+    )
+    issues.start()
+    time.sleep(0.05)
+    project = threading.Thread(
+        target=worker, args=("project", PROJECT_PRIORITY)
+    )
+    project.start()
+    issues.join(timeout=2)
+    project.join(timeout=2)
+
+    assert order == ["project", "issues"]
+
+
+@pytest.mark.parametrize(
+    "url, priority",
+    [
+        ("https://gitlab.com/api/v4/projects?search=test", PROJECT_PRIORITY),
+        ("https://gitlab.com/api/v4/projects/1", PROJECT_PRIORITY),
+        (
+            "https://gitlab.com/api/v4/projects/1/issues?page=2",
+            ISSUE_PAGE_PRIORITY,
+        ),
+    ],
+)
+def test_get_request_priority(url, priority):
+    assert get_request_priority(url) == priority
+
+
+@patch("gitlab_burndown.scheduler.requests.Session.request")
+def test_rate_limited_session_request(mock_request):
+    response = MagicMock(status_code=200, headers={"RateLimit-Remaining": "7"})
+    mock_request.return_value = response
+    scheduler = MagicMock(spec=RateLimitScheduler)
+    session = RateLimitedSession(scheduler)
+
+    result = session.request("GET", "https://gitlab.com/api/v4/projects/1")
+
+    assert result == response
+    scheduler.acquire.assert_called_once_with(PROJECT_PRIORITY)
+    scheduler.update.assert_called_once_with(200, response.headers)
@@ -0,0 +1,47 @@
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# Modules that must only be imported once a command actually needs them.
+LAZY_MODULES = ["gitlab", "matplotlib", "pyarrow", "dotenv", "requests"]
+
+# Import time of main.py on top of typer, in microseconds.
+IMPORT_TIME_BUDGET_US = 100_000
+
+
+def get_import_times(module: str) -> dict[str, int]:
+    """Import a module in a fresh interpreter and return the cumulative
+    import time in microseconds for every module that was imported."""
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        import_times[name.strip()] = int(cumulative)
+    return import_times
+
+
+def test_main_does_not_import_heavy_modules():
+    import_times = get_import_times("main")
+
+    imported = [
+        name for name in import_times if name.split(".")[0] in LAZY_MODULES
+    ]
+    assert imported == []
+
+
+def test_main_import_time_budget():
+    import_times = get_import_times("main")
+
+    own_import_time = import_times["main"] - import_times["typer"]
+    assert own_import_time < IMPORT_TIME_BUDGET_US
@@ -0,0 +1,97 @@
+from datetime import datetime, timezone
+
+import pyarrow as pa
+import pytest
+
+from gitlab_burndown.storage import (
+    export_burndown_data,
+    export_time_info,
+    import_burndown_data,
+    import_time_info,
+    table_to_time_info,
+    time_info_to_table,
+    write_table,
+)
+from gitlab_burndown.transformer import TimeInfo
+
+
+def create_time_info() -> list[TimeInfo]:
+    return [
+        TimeInfo(
+            closed_at=datetime(2024, 9, 5, 12, 0, tzinfo=timezone.utc),
+            time_estimate=3600,
+            created_at=datetime(2024, 9, 1, 9, 0, tzinfo=timezone.utc),
+        ),
+        TimeInfo(
+            closed_at=datetime(2024, 9, 10, 8, 30, tzinfo=timezone.utc),
+            time_estimate=None,
+        ),
+    ]
+
+
+@pytest.mark.parametrize("filename", ["issues.parquet", "issues.arrow"])
+def test_export_and_import_time_info(tmp_path, filename):
+    time_info = create_time_info()
+    path = tmp_path / filename
+
+    export_time_info(time_info_to_table(time_info), path)
+
+    assert table_to_time_info(import_time_info(path)) == time_info
+
+
+@pytest.mark.parametrize("filename", ["burndown.parquet", "burndown.feather"])
+def test_export_and_import_burndown_data(tmp_path, filename):
+    dates = pa.array(
+        [
+            datetime(2024, 9, 1, tzinfo=timezone.utc),
+            datetime(2024, 9, 5, tzinfo=timezone.utc),
+        ]
+    )
+    remaining_estimates = pa.array([3600, 1800])
+    remaining_estimates_hours = pa.array([1.0, 0.5])
+    path = tmp_path / filename
+
+    export_burndown_data(
+        dates, remaining_estimates, remaining_estimates_hours, path
+    )
+
+    table = import_burndown_data(path)
+    assert table.column("date").to_pylist() == dates.to_pylist()
+    assert table.column("remaining_estimate").to_pylist() == [3600, 1800]
+    assert table.column("remaining_estimate_hours").to_pylist() == [1.0, 0.5]
+
+
+def test_import_time_info_without_created_at(tmp_path):
+    path = tmp_path / "issues.parquet"
+    closed_at = datetime(2024, 9, 5, 12, 0, tzinfo=timezone.utc)
+    write_table(
+        pa.table({"closed_at": [closed_at], "time_estimate": [3600]}), path
+    )
+
+    assert table_to_time_info(import_time_info(path)) == [
+        TimeInfo(closed_at=closed_at, time_estimate=3600)
+    ]
+
+
+def test_import_time_info_returns_table(tmp_path):
+    path = tmp_path / "issues.arrow"
+    export_time_info(time_info_to_table(create_time_info()), path)
+
+    table = import_time_info(path)
+
+    assert table.schema.equals(time_info_to_table([]).schema)
+    assert table.column("time_estimate").to_pylist() == [3600, None]
+
+
+def test_time_info_to_table():
+    table = time_info_to_table(create_time_info())
+
+    assert table.num_rows == 2
+    assert table.column("time_estimate").null_count == 1
+
+
+def test_export_time_info_unsupported_format(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported file format '.csv'"):
+        export_time_info(
+            time_info_to_table(create_time_info()), tmp_path / "issues.csv"
+        )
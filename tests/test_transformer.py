@@ -63,6 +63,24 @@ def test_transform_issue_with_missing_time_estimate():
     )
 
 
+def test_transform_issue_with_created_at():
+    # Mock the ProjectIssue with a created_at field
+    issue = MagicMock(spec=ProjectIssue)
+    issue.attributes = {
+        "created_at": "2024-09-01T08:00:00Z",
+        "closed_at": "2024-09-20T12:00:00Z",
+        "time_stats": {"time_estimate": 3600},
+    }
+
+    # Transform the issue into TimeInfo
+    time_info = transform_issue_to_time_info(issue)
+
+    # Check that the created_at is correctly set
+    assert time_info.created_at == datetime(
+        2024, 9, 1, 8, 0, tzinfo=timezone.utc
+    )
+
+
 def test_transform_issue_with_invalid_closed_at_format():
     # Mock the ProjectIssue with an invalid closed_at format
     issue = MagicMock(spec=ProjectIssue)
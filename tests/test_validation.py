@@ -0,0 +1,87 @@
+from datetime import datetime, timedelta, timezone
+
+from gitlab_burndown.storage import table_to_time_info, time_info_to_table
+from gitlab_burndown.transformer import TimeInfo
+from gitlab_burndown.validation import (
+    filter_valid_time_info,
+    validate_time_info,
+)
+
+CLOSED_AT = datetime(2024, 9, 20, 12, 0, tzinfo=timezone.utc)
+
+
+# Helper function to create TimeInfo objects
+def create_time_info(
+    time_estimate: int | None, created_at: datetime | None = None
+) -> TimeInfo:
+    return TimeInfo(
+        closed_at=CLOSED_AT, time_estimate=time_estimate, created_at=created_at
+    )
+
+
+def test_validate_time_info_without_problems():
+    time_info = [create_time_info(3600), create_time_info(7200)]
+
+    report = validate_time_info(time_info_to_table(time_info))
+
+    assert report.total == 2
+    assert not report.has_problems
+    assert report.valid.to_pylist() == [True, True]
+
+
+def test_validate_time_info_with_invalid_estimates():
+    time_info = [
+        create_time_info(3600),
+        create_time_info(None),
+        create_time_info(-60),
+    ]
+
+    report = validate_time_info(time_info_to_table(time_info))
+
+    assert report.missing_estimates == 1
+    assert report.invalid_estimates == 1
+    assert report.valid.to_pylist() == [True, False, False]
+    valid_time_info = filter_valid_time_info(
+        time_info_to_table(time_info), report
+    )
+    assert table_to_time_info(valid_time_info) == [time_info[0]]
+
+
+def test_validate_time_info_with_outliers():
+    time_info = [create_time_info(3600) for _ in range(20)]
+    time_info.append(create_time_info(10_000 * 3600))
+
+    report = validate_time_info(time_info_to_table(time_info))
+
+    assert report.outliers == 1
+    assert all(report.valid.to_pylist())
+
+
+def test_validate_time_info_with_closed_before_created():
+    time_info = [
+        create_time_info(3600, CLOSED_AT - timedelta(days=1)),
+        create_time_info(3600, CLOSED_AT + timedelta(days=1)),
+        create_time_info(3600),
+    ]
+
+    report = validate_time_info(time_info_to_table(time_info))
+
+    assert report.closed_before_created == 1
+    assert all(report.valid.to_pylist())
+
+
+def test_validate_time_info_without_estimates():
+    report = validate_time_info(time_info_to_table([create_time_info(None)]))
+
+    assert report.missing_estimates == 1
+    assert report.outliers == 0
+    assert report.valid.to_pylist() == [False]
+
+
+def test_validation_report_summary():
+    time_info = [create_time_info(3600), create_time_info(None)]
+
+    summary = validate_time_info(time_info_to_table(time_info)).summary()
+
+    assert "Validated 2 issues, skipped 1" in summary
+    assert "missing time estimate:  1" in summary